@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from contextlib import asynccontextmanager
+from typing import Iterable, Optional, Union
 from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
 
+from .executor import CPUExecutor, get_cpu_executor, run_cpu_bound
 from .routers.health import router as _health_router
 
 
@@ -17,6 +19,7 @@ def create_app(
     docs_url: Optional[str] = "/docs",
     redoc_url: Optional[str] = "/redoc",
     openapi_url: Optional[str] = "/openapi.json",
+    executor: Union[bool, int, CPUExecutor, None] = None,
 ) -> FastAPI:
     """
     Create a ready-to-run FastAPI app with sensible defaults.
@@ -35,13 +38,42 @@ def create_app(
         If provided, enables CORS for these origins.
     docs_url, redoc_url, openapi_url : str | None
         Set to None to disable.
+    executor : bool | int | CPUExecutor | None
+        Process pool for CPU-bound handlers, started and stopped with the app.
+        True uses one worker per CPU (``os.cpu_count()`` processes for each
+        uvicorn worker), an int sets the worker count, or pass a configured
+        CPUExecutor. Use ``run_cpu_bound`` to submit work; stats
+        are served on GET /__executor__ when default routes are enabled.
 
     Returns
     -------
     FastAPI
     """
-    app = FastAPI(title=title, version=version,
+    cpu_executor: Optional[CPUExecutor] = None
+    if isinstance(executor, CPUExecutor):
+        cpu_executor = executor
+    elif executor is True:
+        cpu_executor = CPUExecutor()
+    elif isinstance(executor, int) and not isinstance(executor, bool):
+        if executor < 1:
+            raise ValueError("executor worker count must be at least 1")
+        cpu_executor = CPUExecutor(max_workers=executor)
+    elif executor not in (None, False):
+        raise TypeError("executor must be a bool, an int or a CPUExecutor")
+
+    lifespan = None
+    if cpu_executor is not None:
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            await cpu_executor.start()
+            try:
+                yield
+            finally:
+                await cpu_executor.shutdown()
+
+    app = FastAPI(title=title, version=version, lifespan=lifespan,
                   docs_url=docs_url, redoc_url=redoc_url, openapi_url=openapi_url)
+    app.state.cpu_executor = cpu_executor
 
     # CORS
     if cors_origins:
@@ -56,6 +88,13 @@ def create_app(
     # Default lightweight routes
     if include_default_routes:
         app.include_router(_health_router, tags=["__softapi"])
+        if cpu_executor is not None:
+            # async so the stats are read on the event loop, not in the threadpool
+            async def executor_stats():
+                return cpu_executor.stats()
+
+            app.add_api_route("/__executor__", executor_stats,
+                              methods=["GET"], tags=["__softapi"])
 
     # User-provided routers
     if routers:
@@ -65,4 +104,4 @@ def create_app(
     return app
 
 
-__all__ = ["create_app"]
+__all__ = ["create_app", "CPUExecutor", "get_cpu_executor", "run_cpu_bound"]
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Any, Callable, Dict, Optional, Set, TypeVar
+
+from fastapi import HTTPException, Request
+
+T = TypeVar("T")
+
+
+def _warmup() -> int:
+    # Runs in a worker process; only used to force the process to spawn
+    return os.getpid()
+
+
+class CPUExecutor:
+    """
+    Lifespan-scoped process pool for CPU-bound work (reports, images, bcrypt...).
+
+    Parameters
+    ----------
+    max_workers : int | None
+        Number of worker processes. Defaults to ``os.cpu_count()``; note this
+        is per app process, so each uvicorn worker starts its own pool.
+    max_pending : int | None
+        Maximum number of jobs submitted but not finished in the pool. Jobs
+        whose caller timed out or disconnected still count until their worker
+        is done with them. Further calls are rejected with 503 instead of
+        queueing unboundedly. Defaults to ``4 * max_workers``; set to 0 to
+        disable the limit.
+    timeout : float | None
+        Default seconds to wait for a result before answering 504.
+    warmup : bool
+        If True, spawn all workers at startup instead of on first request.
+    mp_context : multiprocessing context | None
+        Start method for workers. Defaults to ``spawn``: forking a server
+        process that already runs threads and an event loop can deadlock.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        timeout: Optional[float] = None,
+        warmup: bool = True,
+        mp_context: Optional[BaseContext] = None,
+    ) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_pending is not None and max_pending < 0:
+            raise ValueError("max_pending must be 0 (unlimited) or positive")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = 4 * self.max_workers if max_pending is None else max_pending
+        self.timeout = timeout
+        self.warmup = warmup
+        self.mp_context = mp_context or multiprocessing.get_context("spawn")
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: Set[Future] = set()
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._rejected = 0
+
+    async def start(self) -> None:
+        if self._pool is not None:
+            return
+        self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                         mp_context=self.mp_context)
+        if self.warmup:
+            await asyncio.gather(*(
+                asyncio.wrap_future(self._pool.submit(_warmup))
+                for _ in range(self.max_workers)
+            ))
+
+    async def shutdown(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            # Don't block the event loop while workers exit
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(pool.shutdown, wait=True, cancel_futures=True)
+            )
+
+    def _notify(self, loop: asyncio.AbstractEventLoop, future: Future) -> None:
+        # Runs on the pool's management thread; hop back onto the event loop
+        try:
+            loop.call_soon_threadsafe(self._on_done, future)
+        except RuntimeError:
+            pass  # loop already closed, nothing left to report to
+
+    def _on_done(self, future: Future) -> None:
+        # Called on the event loop once the pool (not the caller) is done with a job
+        self._pending.discard(future)
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self._failed += 1
+        else:
+            self._completed += 1
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run ``fn(*args, **kwargs)`` in a worker process and await the result.
+
+        ``fn`` and its arguments must be picklable (module-level functions,
+        plain data). Raises 503 when the pool is saturated and 504 on timeout.
+        """
+        if self._pool is None:
+            raise RuntimeError("CPUExecutor is not running; pass executor= to create_app")
+        if self.max_pending and len(self._pending) >= self.max_pending:
+            self._rejected += 1
+            raise HTTPException(status_code=503, detail="CPU executor is busy, retry later")
+
+        loop = asyncio.get_running_loop()
+        future = self._pool.submit(functools.partial(fn, *args, **kwargs))
+        self._pending.add(future)
+        self._submitted += 1
+        future.add_done_callback(functools.partial(self._notify, loop))
+
+        # A job already running in a worker cannot be interrupted; cancelling
+        # only drops it if it is still queued.
+        # Cancelling the asyncio wrapper also detaches it from the job, so a
+        # later failure of an abandoned job is not logged as unretrieved.
+        waiter = asyncio.wrap_future(future)
+        try:
+            done, _ = await asyncio.wait(
+                {waiter},
+                timeout=self.timeout if timeout is None else timeout,
+            )
+        except asyncio.CancelledError:
+            waiter.cancel()
+            future.cancel()
+            raise
+        if not done:
+            waiter.cancel()
+            future.cancel()
+            self._timed_out += 1
+            raise HTTPException(status_code=504, detail="CPU-bound task timed out")
+        return done.pop().result()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Pool occupancy and counters.
+
+        ``active`` counts jobs the pool has handed to its workers. The pool
+        buffers one extra job for dispatch, so ``active`` can exceed
+        ``max_workers`` by one; ``utilization`` is capped at 1.0.
+
+        Call it from the event loop, which is where the counters are updated.
+        """
+        pending = tuple(self._pending)
+        active = sum(1 for f in pending if f.running())
+        return {
+            "started": self._pool is not None,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "in_flight": len(pending),
+            "active": active,
+            "queue_depth": len(pending) - active,
+            "utilization": min(active, self.max_workers) / self.max_workers,
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "timed_out": self._timed_out,
+            "rejected": self._rejected,
+        }
+
+
+def get_cpu_executor(request: Request) -> CPUExecutor:
+    """FastAPI dependency returning the app's CPUExecutor."""
+    executor = getattr(request.app.state, "cpu_executor", None)
+    if executor is None:
+        raise RuntimeError("No CPU executor configured; pass executor= to create_app")
+    return executor
+
+
+async def run_cpu_bound(
+    request: Request,
+    fn: Callable[..., T],
+    *args: Any,
+    timeout: Optional[float] = None,
+    **kwargs: Any,
+) -> T:
+    """
+    Offload ``fn(*args, **kwargs)`` to the app's process pool.
+
+    Example
+    -------
+    @router.post("/report")
+    async def report(request: Request):
+        return await run_cpu_bound(request, build_report, 2024)
+    """
+    return await get_cpu_executor(request).run(fn, *args, timeout=timeout, **kwargs)
+
+
+__all__ = ["CPUExecutor", "get_cpu_executor", "run_cpu_bound"]
@@ -0,0 +1,122 @@
+import gc
+import logging
+import time
+
+import pytest
+from fastapi import APIRouter, Request
+from fastapi.testclient import TestClient
+
+from softapi import CPUExecutor, create_app, run_cpu_bound
+
+
+def square(x: int) -> int:
+    return x * x
+
+
+def nap(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+def raise_timeout() -> None:
+    raise TimeoutError("socket timed out")
+
+
+def nap_then_fail(seconds: float) -> None:
+    time.sleep(seconds)
+    raise ValueError("late failure")
+
+
+router = APIRouter()
+
+
+@router.get("/square/{x}")
+async def square_route(x: int, request: Request):
+    return {"result": await run_cpu_bound(request, square, x)}
+
+
+@router.get("/nap")
+async def nap_route(seconds: float, request: Request):
+    return {"result": await run_cpu_bound(request, nap, seconds, timeout=0.2)}
+
+
+@router.get("/nap-then-fail")
+async def nap_then_fail_route(request: Request):
+    return await run_cpu_bound(request, nap_then_fail, 0.5, timeout=0.1)
+
+
+@router.get("/raise")
+async def raise_route(request: Request):
+    return await run_cpu_bound(request, raise_timeout)
+
+
+def make_app(**kwargs) -> tuple:
+    executor = CPUExecutor(max_workers=1, **kwargs)
+    return create_app(executor=executor, routers=[router]), executor
+
+
+def test_lifespan_starts_and_stops_pool():
+    app, executor = make_app()
+    with TestClient(app) as client:
+        assert client.get("/square/7").json() == {"result": 49}
+        stats = client.get("/__executor__").json()
+        assert stats["started"] is True
+        assert stats["completed"] == 1
+    assert executor.stats()["started"] is False
+
+
+def test_timeout_keeps_job_counted_and_applies_backpressure():
+    app, executor = make_app(max_pending=1)
+    with TestClient(app) as client:
+        assert client.get("/nap", params={"seconds": 1.5}).status_code == 504
+        # The abandoned job still occupies the only worker
+        assert client.get("/square/2").status_code == 503
+        stats = client.get("/__executor__").json()
+        assert stats["in_flight"] == 1
+        assert stats["active"] == 1
+        assert stats["utilization"] == 1.0
+        assert stats["timed_out"] == 1
+        assert stats["rejected"] == 1
+
+        deadline = time.monotonic() + 5
+        while executor.stats()["in_flight"] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert client.get("/square/3").json() == {"result": 9}
+
+
+def test_abandoned_job_failure_is_not_logged(caplog):
+    app, executor = make_app()
+    with caplog.at_level(logging.ERROR, logger="asyncio"):
+        with TestClient(app) as client:
+            assert client.get("/nap-then-fail").status_code == 504
+            deadline = time.monotonic() + 5
+            while executor.stats()["in_flight"] and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert executor.stats()["failed"] == 1
+        gc.collect()
+    assert "never retrieved" not in caplog.text
+
+
+def test_timeout_error_raised_by_job_is_not_a_504():
+    app, executor = make_app()
+    with TestClient(app) as client:
+        with pytest.raises(TimeoutError):
+            client.get("/raise")
+        stats = executor.stats()
+        assert stats["failed"] == 1
+        assert stats["timed_out"] == 0
+
+
+@pytest.mark.parametrize("value", [0, -1])
+def test_invalid_worker_count_rejected(value):
+    with pytest.raises(ValueError):
+        create_app(executor=value)
+    with pytest.raises(ValueError):
+        CPUExecutor(max_workers=value)
+
+
+def test_executor_disabled():
+    app = create_app(executor=False)
+    assert app.state.cpu_executor is None
+    with TestClient(app) as client:
+        assert client.get("/__executor__").status_code == 404